@@ -33,6 +33,8 @@ def create_app() -> FastAPI:
         token = os.environ.get("DATAHUB_TOKEN")
         poll_interval = int(os.environ.get("TOKENIZE_POLL_INTERVAL", "10"))
         batch_limit = int(os.environ.get("TOKENIZE_BATCH_LIMIT", "100"))
+        fetch_workers = int(os.environ.get("TOKENIZE_FETCH_WORKERS", "4"))
+        fetch_batch_size = int(os.environ.get("TOKENIZE_FETCH_BATCH_SIZE", "25"))
 
         try:
             client = DataHubClient(gms_endpoint=gms, token=token)
@@ -43,8 +45,15 @@ def create_app() -> FastAPI:
         detector = PiiDetector.from_env()
         adapter = TokenizationSDKAdapter.from_env()
         manager = RunManager(client, detector, adapter, batch_limit=batch_limit)
-        consumer = MCLConsumer(client, manager, poll_interval=poll_interval)
+        consumer = MCLConsumer(
+            client,
+            manager,
+            poll_interval=poll_interval,
+            fetch_workers=fetch_workers,
+            fetch_batch_size=fetch_batch_size,
+        )
         consumer.start()
+        app.state.client = client
         app.state.consumer = consumer
         app.state.run_manager = manager
         LOGGER.info(
@@ -58,6 +67,9 @@ def create_app() -> FastAPI:
         consumer: MCLConsumer | None = getattr(app.state, "consumer", None)
         if consumer:
             consumer.stop()
+        client: DataHubClient | None = getattr(app.state, "client", None)
+        if client:
+            client.close()
 
     return app
 
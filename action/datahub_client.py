@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .models import DatasetMetadata, DatasetRef
 
@@ -14,6 +16,66 @@ LOGGER = logging.getLogger(__name__)
 
 RUN_TAG_URN = "urn:li:tag:tokenize/run"
 
+# Statuses the HTTP adapter retries before execute() sees the response.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Longest Retry-After we will sleep for. With three retries a busy GMS can
+# add at most a few seconds of sleeping to a request.
+MAX_RETRY_AFTER_SECONDS = 2.0
+
+DATASET_FRAGMENT = """
+fragment tokenizeDataset on Dataset {
+  urn
+  name
+  schemaMetadata {
+    fields {
+      fieldPath
+      nativeDataType
+      globalTags {
+        tags {
+          tag { urn }
+        }
+      }
+    }
+  }
+  editableSchemaMetadata {
+    editableSchemaFieldInfo {
+      fieldPath
+      globalTags {
+        tags {
+          tag { urn }
+        }
+      }
+    }
+  }
+  globalTags {
+    tags {
+      tag { urn }
+    }
+  }
+  editableProperties {
+    customProperties
+  }
+}
+"""
+
+
+class GraphQLHTTPError(RuntimeError):
+    """Raised when GMS answers a GraphQL request with an HTTP error status."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"GraphQL request failed with {status_code}")
+        self.status_code = status_code
+
+
+class _CappedRetry(Retry):
+    """Retry policy that honours Retry-After up to MAX_RETRY_AFTER_SECONDS."""
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER_SECONDS)
+
 
 class DataHubClient:
     """Wrapper around the DataHub GraphQL endpoint used by the action."""
@@ -27,6 +89,29 @@ class DataHubClient:
         self._graphql_url = f"{self._base_url}/graphql"
         self._token = token
         self._timeout = timeout
+        # One pooled keep-alive session per client; the consumer's fetch
+        # threads share it instead of opening a connection per request.
+        # Connection failures and RETRY_STATUSES are retried with exponential
+        # backoff and a capped Retry-After. Read timeouts are not: GMS may
+        # already have applied a mutation, and each retry waits out the full
+        # request timeout again.
+        self._session = requests.Session()
+        retry = _CappedRetry(
+            total=3,
+            read=0,
+            backoff_factor=0.25,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self._headers())
+
+    def close(self) -> None:
+        self._session.close()
 
     # ------------------------------------------------------------------
     # GraphQL helpers
@@ -41,15 +126,14 @@ class DataHubClient:
         self, query: str, variables: Optional[Dict[str, object]] = None
     ) -> Dict[str, object]:
         payload = {"query": query, "variables": variables or {}}
-        response = requests.post(
+        response = self._session.post(
             self._graphql_url,
-            headers=self._headers(),
             data=json.dumps(payload),
             timeout=self._timeout,
         )
         if response.status_code >= 400:
             LOGGER.error("GraphQL error %s: %s", response.status_code, response.text)
-            raise RuntimeError(f"GraphQL request failed with {response.status_code}")
+            raise GraphQLHTTPError(response.status_code)
         data = response.json()
         if data.get("errors"):
             LOGGER.error("GraphQL errors: %s", data["errors"])
@@ -93,53 +177,46 @@ class DataHubClient:
             total = payload.get("total") or 0
             if start >= total:
                 break
-        return urns
+        # Offset paging can repeat an entity if the listing shifts between pages.
+        return list(dict.fromkeys(urns))
 
     def get_dataset(self, urn: str) -> Optional[DatasetMetadata]:
         query = """
         query getDataset($urn: String!) {
           dataset(urn: $urn) {
-            urn
-            name
-            platform { urn }
-            schemaMetadata {
-              fields {
-                fieldPath
-                nativeDataType
-                globalTags {
-                  tags {
-                    tag { urn }
-                  }
-                }
-              }
-            }
-            editableSchemaMetadata {
-              editableSchemaFieldInfo {
-                fieldPath
-                globalTags {
-                  tags {
-                    tag { urn }
-                  }
-                }
-              }
-            }
-            globalTags {
-              tags {
-                tag { urn }
-              }
-            }
-            editableProperties {
-              customProperties
-            }
+            ...tokenizeDataset
           }
         }
         """
-        data = self.execute(query, {"urn": urn})
+        data = self.execute(query + DATASET_FRAGMENT, {"urn": urn})
         payload = data.get("dataset")
         if not payload:
             return None
         return DatasetMetadata.from_graphql(urn, payload)
 
+    def get_datasets(self, urns: Sequence[str]) -> List[Optional[DatasetMetadata]]:
+        """Fetch several datasets in one GraphQL request, preserving order."""
+
+        if not urns:
+            return []
+        params = ", ".join(f"$urn{index}: String!" for index in range(len(urns)))
+        selections = "\n".join(
+            f"  d{index}: dataset(urn: $urn{index}) {{ ...tokenizeDataset }}"
+            for index in range(len(urns))
+        )
+        query = f"query getDatasets({params}) {{\n{selections}\n}}\n{DATASET_FRAGMENT}"
+        variables: Dict[str, object] = {
+            f"urn{index}": urn for index, urn in enumerate(urns)
+        }
+        data = self.execute(query, variables)
+        datasets: List[Optional[DatasetMetadata]] = []
+        for index, urn in enumerate(urns):
+            payload = data.get(f"d{index}")
+            datasets.append(
+                DatasetMetadata.from_graphql(urn, payload) if payload else None
+            )
+        return datasets
+
     # ------------------------------------------------------------------
     # Tag management
     # ------------------------------------------------------------------
@@ -153,20 +230,12 @@ class DataHubClient:
     ) -> None:
         mutation = """
         mutation addTag($input: TagAssociationInput!) {
-          addTag(input: $input) {
-            __typename
-          }
+          addTag(input: $input)
         }
         """
-        variables: Dict[str, object] = {
-            "input": {
-                "tagUrn": tag_urn,
-                "resourceUrn": entity_urn,
-            }
+        variables = {
+            "input": _tag_input(entity_urn, tag_urn, subresource, subresource_type)
         }
-        if subresource:
-            variables["input"]["subResource"] = subresource
-            variables["input"]["subResourceType"] = subresource_type or "DATASET_FIELD"
         self.execute(mutation, variables)
 
     def remove_tag(
@@ -182,15 +251,9 @@ class DataHubClient:
           removeTag(input: $input)
         }
         """
-        variables: Dict[str, object] = {
-            "input": {
-                "tagUrn": tag_urn,
-                "resourceUrn": entity_urn,
-            }
+        variables = {
+            "input": _tag_input(entity_urn, tag_urn, subresource, subresource_type)
         }
-        if subresource:
-            variables["input"]["subResource"] = subresource
-            variables["input"]["subResourceType"] = subresource_type or "DATASET_FIELD"
         self.execute(mutation, variables)
 
     # ------------------------------------------------------------------
@@ -224,29 +287,104 @@ class DataHubClient:
         *,
         field_path: Optional[str] = None,
     ) -> None:
-        for tag in tags_to_remove:
+        additions = list(tags_to_add)
+        removals = list(tags_to_remove)
+        if not additions and not removals:
+            return
+        subresource_type = "DATASET_FIELD" if field_path else None
+        try:
+            self._apply_tag_changes(
+                entity_urn, additions, removals, field_path, subresource_type
+            )
+            return
+        except Exception as exc:
+            if _is_retried_failure(exc):
+                # The adapter already retried this request; one call per tag
+                # would only put more load on a GMS that is struggling.
+                LOGGER.warning(
+                    "Tag update for %s failed after retries (%s); not retrying per tag",
+                    entity_urn,
+                    exc,
+                )
+                return
+            LOGGER.debug(
+                "Combined tag update for %s failed (%s); retrying per tag",
+                entity_urn,
+                exc,
+            )
+        for tag in removals:
             try:
                 self.remove_tag(
                     entity_urn,
                     tag,
                     subresource=field_path,
-                    subresource_type="DATASET_FIELD" if field_path else None,
+                    subresource_type=subresource_type,
                 )
             except Exception as exc:  # pragma: no cover - best effort logging
                 LOGGER.debug(
                     "Failed to remove tag %s from %s: %s", tag, entity_urn, exc
                 )
-        for tag in tags_to_add:
+        for tag in additions:
             try:
                 self.add_tag(
                     entity_urn,
                     tag,
                     subresource=field_path,
-                    subresource_type="DATASET_FIELD" if field_path else None,
+                    subresource_type=subresource_type,
                 )
             except Exception as exc:  # pragma: no cover - best effort logging
                 LOGGER.debug("Failed to add tag %s to %s: %s", tag, entity_urn, exc)
 
+    def _apply_tag_changes(
+        self,
+        entity_urn: str,
+        additions: Sequence[str],
+        removals: Sequence[str],
+        subresource: Optional[str],
+        subresource_type: Optional[str],
+    ) -> None:
+        """Send all tag changes as one document of aliased mutations.
+
+        Mutation fields run serially in document order, so removals still
+        happen before additions.
+        """
+
+        operations = [("removeTag", tag) for tag in removals] + [
+            ("addTag", tag) for tag in additions
+        ]
+        params = ", ".join(
+            f"$input{index}: TagAssociationInput!" for index in range(len(operations))
+        )
+        selections = "\n".join(
+            f"  op{index}: {name}(input: $input{index})"
+            for index, (name, _) in enumerate(operations)
+        )
+        mutation = f"mutation ensureTags({params}) {{\n{selections}\n}}"
+        variables: Dict[str, object] = {
+            f"input{index}": _tag_input(entity_urn, tag, subresource, subresource_type)
+            for index, (_, tag) in enumerate(operations)
+        }
+        self.execute(mutation, variables)
+
+
+def _tag_input(
+    entity_urn: str,
+    tag_urn: str,
+    subresource: Optional[str],
+    subresource_type: Optional[str],
+) -> Dict[str, str]:
+    payload = {"tagUrn": tag_urn, "resourceUrn": entity_urn}
+    if subresource:
+        payload["subResource"] = subresource
+        payload["subResourceType"] = subresource_type or "DATASET_FIELD"
+    return payload
+
+
+def _is_retried_failure(exc: Exception) -> bool:
+    if isinstance(exc, GraphQLHTTPError):
+        return exc.status_code in RETRY_STATUSES
+    return isinstance(exc, requests.ConnectionError)
+
 
 def to_dataset_ref(urn: str) -> DatasetRef:
     return DatasetRef.from_urn(urn)
@@ -69,16 +69,10 @@ def tokenize_table(
             rows = cursor.fetchall()
             LOGGER.info("Fetched %s candidate rows from Databricks", len(rows))
 
+            tokenize_row = adapter.tokenize_row
             for row in rows:
                 row_id = row[0]
-                current_values = dict(zip(columns, row[1:]))
-                updates: Dict[str, str] = {}
-                for column, value in current_values.items():
-                    if value is None:
-                        continue
-                    if adapter.is_token(value):
-                        continue
-                    updates[column] = adapter.tokenize(value)
+                updates = tokenize_row(columns, row[1:])
                 if not updates:
                     skipped_rows += 1
                     continue
@@ -7,6 +7,7 @@ from typing import Dict, List, Sequence, Tuple
 
 import psycopg2
 from psycopg2 import sql
+from psycopg2.extras import execute_batch
 
 from .models import DatasetRef, TokenizationResult
 from .sdk_adapter import TokenizationSDKAdapter
@@ -44,6 +45,18 @@ def _build_select_query(
     return query, params
 
 
+def _build_update_query(dataset: DatasetRef, columns: Sequence[str]) -> sql.Composed:
+    assignments = [
+        sql.SQL("{} = %s").format(sql.Identifier(column)) for column in columns
+    ]
+    return sql.SQL("UPDATE {} SET {} WHERE id = %s").format(
+        sql.SQL("{}.{}").format(
+            sql.Identifier(dataset.schema), sql.Identifier(dataset.table)
+        ),
+        sql.SQL(", ").join(assignments),
+    )
+
+
 def tokenize_table(
     conn_str: str,
     dataset: DatasetRef,
@@ -63,34 +76,31 @@ def tokenize_table(
             rows = cursor.fetchall()
             LOGGER.info("Fetched %s candidate rows from Postgres", len(rows))
 
+            pending: Dict[Tuple[str, ...], List[List[object]]] = {}
+            tokenize_row = adapter.tokenize_row
             for row in rows:
                 row_id = row[0]
-                current_values = dict(zip(columns, row[1:]))
-                updates: Dict[str, str] = {}
-                for column, value in current_values.items():
-                    if value is None:
-                        continue
-                    if adapter.is_token(value):
-                        continue
-                    updates[column] = adapter.tokenize(value)
+                updates = tokenize_row(columns, row[1:])
 
                 if not updates:
                     skipped_rows += 1
                     continue
 
-                assignments = [
-                    sql.SQL("{} = %s").format(sql.Identifier(column))
-                    for column in updates
-                ]
-                update_query = sql.SQL("UPDATE {} SET {} WHERE id = %s").format(
-                    sql.SQL("{}.{}").format(
-                        sql.Identifier(dataset.schema), sql.Identifier(dataset.table)
-                    ),
-                    sql.SQL(", ").join(assignments),
+                pending.setdefault(tuple(updates), []).append(
+                    list(updates.values()) + [row_id]
                 )
-                cursor.execute(update_query, list(updates.values()) + [row_id])
                 updated_rows += 1
 
+            # Rows touching the same columns share one statement shape, so send
+            # each group in as few round-trips as possible.
+            for update_columns, batch_params in pending.items():
+                execute_batch(
+                    cursor,
+                    _build_update_query(dataset, update_columns),
+                    batch_params,
+                    page_size=limit,
+                )
+
         connection.commit()
 
     LOGGER.info(
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Optional, Sequence, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Sequence, Set
 
 from .datahub_client import DataHubClient, RUN_TAG_URN
 from .models import DatasetMetadata
-from .run_manager import RunManager
+
+if TYPE_CHECKING:  # pragma: no cover - avoids importing the database drivers
+    from .run_manager import RunManager
 
 LOGGER = logging.getLogger(__name__)
 
@@ -22,10 +25,14 @@ class MCLConsumer:
         run_manager: RunManager,
         *,
         poll_interval: int = 10,
+        fetch_workers: int = 4,
+        fetch_batch_size: int = 25,
     ) -> None:
         self.client = client
         self.run_manager = run_manager
         self.poll_interval = max(poll_interval, 5)
+        self.fetch_workers = max(fetch_workers, 1)
+        self.fetch_batch_size = max(fetch_batch_size, 1)
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
 
@@ -59,24 +66,48 @@ class MCLConsumer:
 
     def _poll_once(self) -> None:
         dataset_urns = self.client.list_all_dataset_urns()
-        for urn in dataset_urns:
-            dataset = self.client.get_dataset(urn)
-            if not dataset:
-                continue
-            field_scope = self._fields_with_run_tag(dataset)
-            dataset_tagged = RUN_TAG_URN in dataset.global_tags
-            if not dataset_tagged and not field_scope:
-                continue
-            LOGGER.info(
-                "Detected tokenize/run tag on %s (dataset=%s, fields=%s)",
-                urn,
-                dataset_tagged,
-                len(field_scope),
-            )
-            explicit_scope: Optional[Sequence[str]] = (
-                None if dataset_tagged else list(field_scope)
-            )
-            self.run_manager.process(dataset, explicit_scope)
+        size = self.fetch_batch_size
+        batches = [
+            dataset_urns[start : start + size]
+            for start in range(0, len(dataset_urns), size)
+        ]
+        # Each batch is one GraphQL request; overlap the requests but still
+        # process runs one at a time in listing order. The prefetched
+        # metadata is only used to spot the run tag.
+        with ThreadPoolExecutor(
+            max_workers=self.fetch_workers, thread_name_prefix="tokenize-fetch"
+        ) as executor:
+            results = executor.map(self.client.get_datasets, batches)
+            for batch, datasets in zip(batches, results):
+                for urn, dataset in zip(batch, datasets):
+                    if dataset and self._has_run_tag(dataset):
+                        self._process_dataset(urn)
+
+    def _process_dataset(self, urn: str) -> None:
+        # Earlier runs in this poll can take a while, so re-read the dataset
+        # rather than acting on (and writing back) a stale snapshot.
+        dataset = self.client.get_dataset(urn)
+        if not dataset or not self._has_run_tag(dataset):
+            LOGGER.info("tokenize/run tag no longer present on %s; skipping", urn)
+            return
+        field_scope = self._fields_with_run_tag(dataset)
+        dataset_tagged = RUN_TAG_URN in dataset.global_tags
+        LOGGER.info(
+            "Detected tokenize/run tag on %s (dataset=%s, fields=%s)",
+            urn,
+            dataset_tagged,
+            len(field_scope),
+        )
+        explicit_scope: Optional[Sequence[str]] = (
+            None if dataset_tagged else list(field_scope)
+        )
+        self.run_manager.process(dataset, explicit_scope)
+
+    @classmethod
+    def _has_run_tag(cls, dataset: DatasetMetadata) -> bool:
+        return RUN_TAG_URN in dataset.global_tags or bool(
+            cls._fields_with_run_tag(dataset)
+        )
 
     @staticmethod
     def _fields_with_run_tag(dataset: DatasetMetadata) -> Set[str]:
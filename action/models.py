@@ -42,15 +42,15 @@ class DatasetRef(BaseModel):
         platform_urn = match.group("platform")
         name = match.group("name")
         env = match.group("env")
-        parts = name.split(".")
-        if len(parts) == 2:
-            database = "default"
-            schema_name, table = parts
+        head, sep, tail = name.partition(".")
+        if not sep:
+            raise ValueError(f"Unsupported dataset URN: {urn}")
+        schema_name, sep, table = tail.partition(".")
+        if sep:
+            database = head
         else:
-            database = parts[0]
-            schema_name = parts[1]
-            table = ".".join(parts[2:]) if len(parts) > 2 else parts[1]
-        platform = platform_urn.split(":")[-1]
+            database, schema_name, table = "default", head, tail
+        platform = platform_urn.rpartition(":")[2]
         return cls(
             urn=urn,
             platform=platform,
@@ -78,7 +78,7 @@ class FieldMetadata(BaseModel):
 
     @property
     def column(self) -> str:
-        return self.field_path.split(".")[-1]
+        return self.field_path.rpartition(".")[2]
 
 
 class DatasetMetadata(BaseModel):
@@ -160,7 +160,7 @@ def _extract_tag_set(tag_payload: Optional[object]) -> Set[str]:
     return tags
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenizationResult:
     columns: Sequence[str]
     rows_updated: int
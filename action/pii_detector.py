@@ -39,6 +39,7 @@ PII_TAG_SUFFIXES = {
     "pii.contact",
     "sensitive",
 }
+_PII_TAG_SUFFIX_TUPLE = tuple(PII_TAG_SUFFIXES)
 
 
 @dataclass
@@ -67,6 +68,10 @@ class PiiDetector:
             key: re.compile(pattern)
             for key, pattern in self.config.regex_validators.items()
         }
+        self._name_patterns = [pattern.lower() for pattern in config.name_patterns]
+        self._name_prefilter = re.compile(
+            "|".join(re.escape(pattern) for pattern in self._name_patterns)
+        )
 
     @classmethod
     def from_env(cls) -> "PiiDetector":
@@ -124,25 +129,22 @@ class PiiDetector:
         return None
 
     def _has_pii_tag(self, field: FieldMetadata) -> bool:
-        suffixes = tuple(PII_TAG_SUFFIXES)
-        for tag in field.tags:
-            if tag.endswith(suffixes):
-                return True
-            if tag.startswith("urn:li:tag:") and tag.split(":")[-1] in PII_TAG_SUFFIXES:
-                return True
-        return False
+        # A tag whose last ":" segment is a PII suffix also ends with it, so a
+        # single endswith scan covers both plain and urn:li:tag: forms.
+        return any(tag.endswith(_PII_TAG_SUFFIX_TUPLE) for tag in field.tags)
 
     def _heuristic_detection(
         self,
         fields: Sequence[FieldMetadata],
         samples: Dict[str, Sequence[str]],
     ) -> Set[str]:
-        patterns = [pattern.lower() for pattern in self.config.name_patterns]
         detected: Set[str] = set()
         for field in fields:
             column = field.column
             lowered = column.lower()
-            for pattern in patterns:
+            if not self._name_prefilter.search(lowered):
+                continue
+            for pattern in self._name_patterns:
                 if pattern in lowered:
                     if self._validate_with_samples(pattern, column, samples):
                         detected.add(column)
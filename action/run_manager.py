@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import uuid
@@ -22,6 +21,11 @@ STATUS_SUCCESS_TAG = "urn:li:tag:tokenize/status:SUCCESS"
 STATUS_FAILED_TAG = "urn:li:tag:tokenize/status:FAILED"
 FIELD_TOKENIZED_TAG = "urn:li:tag:tokenized"
 
+SUCCESS_TAGS_TO_ADD = frozenset({DONE_TAG_URN, STATUS_SUCCESS_TAG})
+SUCCESS_TAGS_TO_REMOVE = frozenset({RUN_TAG_URN, STATUS_FAILED_TAG})
+FAILURE_TAGS_TO_ADD = frozenset({STATUS_FAILED_TAG})
+FAILURE_TAGS_TO_REMOVE = frozenset({STATUS_SUCCESS_TAG})
+
 
 class RunManager:
     """Orchestrates tokenization runs and DataHub updates."""
@@ -128,11 +132,8 @@ class RunManager:
 
     # ------------------------------------------------------------------
     def _record_status(self, dataset: DatasetMetadata, status: RunStatus) -> None:
-        payload = status.dict()
-        payload["started_at"] = status.started_at.isoformat()
-        payload["ended_at"] = status.ended_at.isoformat() if status.ended_at else None
         properties = dict(dataset.editable_properties)
-        properties["last_tokenization_run"] = json.dumps(payload)
+        properties["last_tokenization_run"] = status.json()
         self.client.upsert_editable_properties(dataset.urn, properties)
 
     def _finalise_success(
@@ -141,17 +142,15 @@ class RunManager:
         LOGGER.info("Finalising successful run for %s", dataset.urn)
         self.client.ensure_tags(
             dataset.urn,
-            tags_to_add={DONE_TAG_URN, STATUS_SUCCESS_TAG},
-            tags_to_remove={RUN_TAG_URN, STATUS_FAILED_TAG},
+            tags_to_add=SUCCESS_TAGS_TO_ADD,
+            tags_to_remove=SUCCESS_TAGS_TO_REMOVE,
         )
-        field_map = dataset.field_map()
-        processed_fields: Set[str] = set()
+        tokenized_columns = set(columns)
         for field in dataset.fields:
             additions: Set[str] = set()
             removals: Set[str] = set()
-            if field.column in columns:
+            if field.column in tokenized_columns:
                 additions.add(FIELD_TOKENIZED_TAG)
-                processed_fields.add(field.field_path)
             if RUN_TAG_URN in field.tags:
                 removals.add(RUN_TAG_URN)
             if additions or removals:
@@ -161,23 +160,11 @@ class RunManager:
                     tags_to_remove=removals,
                     field_path=field.field_path,
                 )
-        for column in columns:
-            field = field_map.get(column)
-            if not field:
-                continue
-            if field.field_path in processed_fields:
-                continue
-            self.client.ensure_tags(
-                dataset.urn,
-                tags_to_add={FIELD_TOKENIZED_TAG},
-                tags_to_remove=set(),
-                field_path=field.field_path,
-            )
 
     def _mark_failure(self, dataset: DatasetMetadata) -> None:
         LOGGER.info("Marking run failure for %s", dataset.urn)
         self.client.ensure_tags(
             dataset.urn,
-            tags_to_add={STATUS_FAILED_TAG},
-            tags_to_remove={STATUS_SUCCESS_TAG},
+            tags_to_add=FAILURE_TAGS_TO_ADD,
+            tags_to_remove=FAILURE_TAGS_TO_REMOVE,
         )
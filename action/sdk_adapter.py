@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from . import token_logic
 
@@ -35,3 +35,15 @@ class TokenizationSDKAdapter:
 
     def is_token(self, value: str) -> bool:
         return token_logic.is_token(value)
+
+    def tokenize_row(
+        self, columns: Sequence[str], values: Iterable[Optional[str]]
+    ) -> Dict[str, str]:
+        """Return new tokens keyed by column for values still in plaintext."""
+        is_token = self.is_token
+        tokenize = self.tokenize
+        return {
+            column: tokenize(value)
+            for column, value in zip(columns, values)
+            if value is not None and not is_token(value)
+        }
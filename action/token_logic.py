@@ -26,6 +26,9 @@ def is_token(value: Optional[str]) -> bool:
     """Return True if the value already matches the dummy token format."""
     if value is None:
         return False
+    # Cheap rejection for plaintext before running the regex.
+    if not (value.startswith(TOKEN_PREFIX) and value.endswith(TOKEN_SUFFIX)):
+        return False
     return bool(TOKEN_REGEX.match(value))
 
 
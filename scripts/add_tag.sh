@@ -18,7 +18,7 @@ fi
 
 payload=$(cat <<JSON
 {
-  "query": "mutation addTag($input: TagAssociationInput!) { addTag(input: $input) { __typename } }",
+  "query": "mutation addTag(\$input: TagAssociationInput!) { addTag(input: \$input) }",
   "variables": {
     "input": {
       "tagUrn": "${TAG_URN}",
@@ -28,6 +28,8 @@ http_path = params.get("httpPath", [None])[0]
 token = params.get("PWD", [None])[0] or params.get("pwd", [None])[0]
 if not http_path or not token:
     raise SystemExit("JDBC URL missing httpPath or token")
-print(f"INGEST_DBX_SERVER={host}")
-print(f"INGEST_DBX_HTTP_PATH={http_path}")
-print(f"INGEST_DBX_TOKEN={token}")
+sys.stdout.write(
+    f"INGEST_DBX_SERVER={host}\n"
+    f"INGEST_DBX_HTTP_PATH={http_path}\n"
+    f"INGEST_DBX_TOKEN={token}\n"
+)
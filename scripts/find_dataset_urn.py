@@ -57,10 +57,6 @@ def main() -> int:
         searchResults {
           entity {
             urn
-            ... on Dataset {
-              platform { urn }
-              name
-            }
           }
         }
       }
@@ -18,8 +18,10 @@ password = parsed.password or ""
 host = parsed.hostname or "localhost"
 port = parsed.port or 5432
 path = parsed.path.lstrip("/")
-print(f"INGEST_PG_USERNAME={user}")
-print(f"INGEST_PG_PASSWORD={password}")
-print(f"INGEST_PG_HOST={host}")
-print(f"INGEST_PG_PORT={port}")
-print(f"INGEST_PG_DATABASE={path}")
+sys.stdout.write(
+    f"INGEST_PG_USERNAME={user}\n"
+    f"INGEST_PG_PASSWORD={password}\n"
+    f"INGEST_PG_HOST={host}\n"
+    f"INGEST_PG_PORT={port}\n"
+    f"INGEST_PG_DATABASE={path}\n"
+)
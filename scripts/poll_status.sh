@@ -34,20 +34,48 @@ if [ -n "$DATAHUB_TOKEN" ]; then
   curl_args+=(-H "Authorization: Bearer ${DATAHUB_TOKEN}")
 fi
 
-start=$(date +%s)
+# Poll quickly at first so short runs are noticed promptly, then back off
+# exponentially up to INTERVAL without sleeping past the timeout.
+delay=1
+if [ "$INTERVAL" -lt "$delay" ]; then
+  delay=$INTERVAL
+fi
+
+backoff_sleep() {
+  local remaining=$((deadline - SECONDS))
+  if [ "$delay" -lt "$remaining" ]; then
+    sleep "$delay"
+  elif [ "$remaining" -gt 0 ]; then
+    sleep "$remaining"
+  fi
+  delay=$((delay * 2))
+  if [ "$delay" -gt "$INTERVAL" ]; then
+    delay=$INTERVAL
+  fi
+}
+
+last_status=""
+last_response=""
+deadline=$((SECONDS + TIMEOUT))
 while true; do
-  now=$(date +%s)
-  elapsed=$((now - start))
-  if [ "$elapsed" -ge "$TIMEOUT" ]; then
+  if [ "$SECONDS" -ge "$deadline" ]; then
     printf '%s\n' "Timed out waiting for last_tokenization_run" >&2
     exit 1
   fi
   response=$(curl "${curl_args[@]}")
+  if [ "$response" = "$last_response" ]; then
+    backoff_sleep
+    continue
+  fi
+  last_response=$response
   raw_status=$(printf '%s' "$response" |
     jq -r '.data.dataset.editableProperties.customProperties.last_tokenization_run // empty' || true)
   if [ -n "$raw_status" ] && [ "$raw_status" != "null" ]; then
     status_value=$(printf '%s' "$raw_status" | jq -r 'fromjson.status' 2>/dev/null || true)
-    printf '%s\n' "Current status: ${status_value:-unknown}" >&2
+    if [ "${status_value:-unknown}" != "$last_status" ]; then
+      printf '%s\n' "Current status: ${status_value:-unknown}" >&2
+      last_status=${status_value:-unknown}
+    fi
     if [ "$status_value" = "SUCCESS" ]; then
       printf '%s\n' "$raw_status" | jq -c 'fromjson'
       exit 0
@@ -56,8 +84,9 @@ while true; do
       printf '%s\n' "$raw_status" | jq -c 'fromjson' >&2
       exit 2
     fi
-  else
+  elif [ -z "$last_status" ]; then
     printf '%s\n' "Waiting for status..." >&2
+    last_status="pending"
   fi
-  sleep "$INTERVAL"
+  backoff_sleep
 done
@@ -160,9 +160,13 @@ wait_for_postgres() {
   log "Waiting for Postgres to become ready"
   kubectl -n "$NAMESPACE" rollout status statefulset/postgresql --timeout=300s >/dev/null 2>&1 || true
   local deadline=$((SECONDS + 300))
+  local pod=""
   while (( SECONDS < deadline )); do
-    local pod
-    pod=$(kubectl -n "$NAMESPACE" get pods -l app.kubernetes.io/name=postgresql -o jsonpath='{.items[0].metadata.name}' 2>/dev/null || true)
+    # StatefulSet pod names are stable, so resolve the name once and only
+    # keep polling readiness afterwards.
+    if [[ -z "$pod" ]]; then
+      pod=$(kubectl -n "$NAMESPACE" get pods -l app.kubernetes.io/name=postgresql -o jsonpath='{.items[0].metadata.name}' 2>/dev/null || true)
+    fi
     if [[ -z "$pod" ]]; then
       sleep 5
       continue
@@ -0,0 +1,181 @@
+"""Tests for the DataHub GraphQL client."""
+
+from __future__ import annotations
+
+import json
+import socket
+from typing import Dict, List, Optional
+
+from action.datahub_client import MAX_RETRY_AFTER_SECONDS, DataHubClient
+
+
+def dataset_urn(name: str) -> str:
+    return f"urn:li:dataset:(urn:li:dataPlatform:postgres,{name},PROD)"
+
+
+class FakeResponse:
+    def __init__(
+        self,
+        data: Optional[Dict[str, object]] = None,
+        *,
+        status_code: int = 200,
+        errors: Optional[List[Dict[str, object]]] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.text = ""
+        self._body = {"data": data or {}, "errors": errors}
+
+    def json(self) -> Dict[str, object]:
+        return self._body
+
+
+def stub_post(monkeypatch, client: DataHubClient, *responses: FakeResponse):
+    """Replace the session's POST and return the decoded payloads it receives."""
+
+    sent: List[Dict[str, object]] = []
+    pending = list(responses)
+
+    def post(url: str, data: str, timeout: int) -> FakeResponse:
+        sent.append(json.loads(data))
+        return pending.pop(0)
+
+    monkeypatch.setattr(client._session, "post", post)
+    return sent
+
+
+def test_get_datasets_maps_aliases_back_to_urns_in_order(monkeypatch) -> None:
+    client = DataHubClient("http://gms")
+    urns = [dataset_urn("public.a"), dataset_urn("public.b"), dataset_urn("public.c")]
+    sent = stub_post(
+        monkeypatch,
+        client,
+        FakeResponse(
+            {
+                "d0": {"name": "a"},
+                "d1": None,
+                "d2": {"name": "c", "globalTags": {"tags": [{"tag": {"urn": "t"}}]}},
+            }
+        ),
+    )
+
+    datasets = client.get_datasets(urns)
+
+    assert len(sent) == 1
+    assert sent[0]["variables"] == {"urn0": urns[0], "urn1": urns[1], "urn2": urns[2]}
+    assert "d2: dataset(urn: $urn2)" in sent[0]["query"]
+    assert [dataset.urn if dataset else None for dataset in datasets] == [
+        urns[0],
+        None,
+        urns[2],
+    ]
+    assert datasets[2].global_tags == {"t"}
+
+
+def test_get_datasets_skips_request_for_empty_batch(monkeypatch) -> None:
+    client = DataHubClient("http://gms")
+    sent = stub_post(monkeypatch, client)
+    assert client.get_datasets([]) == []
+    assert sent == []
+
+
+def test_ensure_tags_sends_removals_before_additions_in_one_document(
+    monkeypatch,
+) -> None:
+    client = DataHubClient("http://gms")
+    urn = dataset_urn("public.a")
+    sent = stub_post(
+        monkeypatch, client, FakeResponse({"op0": True, "op1": True, "op2": True})
+    )
+
+    client.ensure_tags(urn, ["urn:li:tag:done"], ["urn:li:tag:run", "urn:li:tag:err"])
+
+    assert len(sent) == 1
+    assert sent[0]["query"] == (
+        "mutation ensureTags($input0: TagAssociationInput!, "
+        "$input1: TagAssociationInput!, $input2: TagAssociationInput!) {\n"
+        "  op0: removeTag(input: $input0)\n"
+        "  op1: removeTag(input: $input1)\n"
+        "  op2: addTag(input: $input2)\n"
+        "}"
+    )
+    assert sent[0]["variables"] == {
+        "input0": {"tagUrn": "urn:li:tag:run", "resourceUrn": urn},
+        "input1": {"tagUrn": "urn:li:tag:err", "resourceUrn": urn},
+        "input2": {"tagUrn": "urn:li:tag:done", "resourceUrn": urn},
+    }
+
+
+def test_ensure_tags_falls_back_to_per_tag_mutations(monkeypatch) -> None:
+    client = DataHubClient("http://gms")
+    urn = dataset_urn("public.a")
+    sent = stub_post(
+        monkeypatch,
+        client,
+        FakeResponse(errors=[{"message": "boom"}]),
+        FakeResponse({"removeTag": True}),
+        FakeResponse({"addTag": True}),
+    )
+
+    client.ensure_tags(urn, ["urn:li:tag:done"], ["urn:li:tag:run"], field_path="email")
+
+    field_input = {
+        "resourceUrn": urn,
+        "subResource": "email",
+        "subResourceType": "DATASET_FIELD",
+    }
+    assert len(sent) == 3
+    assert "removeTag(input: $input)\n" in sent[1]["query"]
+    assert sent[1]["variables"] == {"input": dict(field_input, tagUrn="urn:li:tag:run")}
+    assert "addTag(input: $input)\n" in sent[2]["query"]
+    assert sent[2]["variables"] == {
+        "input": dict(field_input, tagUrn="urn:li:tag:done")
+    }
+
+
+def test_ensure_tags_skips_fallback_after_retried_status(monkeypatch) -> None:
+    client = DataHubClient("http://gms")
+    sent = stub_post(monkeypatch, client, FakeResponse(status_code=503))
+
+    client.ensure_tags(dataset_urn("public.a"), ["urn:li:tag:done"], ["urn:li:tag:run"])
+
+    assert len(sent) == 1
+
+
+class RetryAfterResponse:
+    def __init__(self, retry_after: str) -> None:
+        self.headers = {"Retry-After": retry_after}
+
+
+def test_retry_after_is_capped() -> None:
+    client = DataHubClient("http://gms")
+    retry = client._session.get_adapter("http://gms/graphql").max_retries
+    # urllib3 rebuilds the policy on every attempt; the cap must survive that.
+    retry = retry.increment(method="POST", url="/graphql", response=None)
+
+    assert retry.get_retry_after(RetryAfterResponse("1")) == 1
+    assert retry.get_retry_after(RetryAfterResponse("3600")) == MAX_RETRY_AFTER_SECONDS
+
+
+def test_read_timeout_is_not_retried() -> None:
+    # A listener that accepts connections but never answers.
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    try:
+        client = DataHubClient(f"http://127.0.0.1:{server.getsockname()[1]}", timeout=1)
+        client.ensure_tags(
+            dataset_urn("public.a"), ["urn:li:tag:done"], ["urn:li:tag:run"]
+        )
+
+        server.setblocking(False)
+        posts = 0
+        while True:
+            try:
+                conn, _ = server.accept()
+            except BlockingIOError:
+                break
+            conn.close()
+            posts += 1
+        assert posts == 1
+    finally:
+        server.close()
@@ -0,0 +1,42 @@
+"""Tests for dataset URN parsing."""
+
+from __future__ import annotations
+
+import pytest
+
+from action.models import DatasetRef, FieldMetadata
+
+
+def dataset_urn(name: str, platform: str = "postgres") -> str:
+    return f"urn:li:dataset:(urn:li:dataPlatform:{platform},{name},PROD)"
+
+
+def test_two_part_name_uses_default_database() -> None:
+    ref = DatasetRef.from_urn(dataset_urn("public.customers"))
+    assert (ref.database, ref.schema, ref.table) == ("default", "public", "customers")
+    assert ref.platform == "postgres"
+
+
+def test_three_part_name_splits_database_schema_table() -> None:
+    ref = DatasetRef.from_urn(dataset_urn("main.sales.orders", platform="databricks"))
+    assert (ref.database, ref.schema, ref.table) == ("main", "sales", "orders")
+    assert ref.table_expression == "`main`.`sales`.`orders`"
+
+
+def test_extra_dots_stay_in_table_name() -> None:
+    ref = DatasetRef.from_urn(dataset_urn("postgres.public.customers.v2"))
+    assert (ref.database, ref.schema, ref.table) == (
+        "postgres",
+        "public",
+        "customers.v2",
+    )
+
+
+def test_single_part_name_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        DatasetRef.from_urn(dataset_urn("customers"))
+
+
+def test_field_column_is_last_path_segment() -> None:
+    assert FieldMetadata(field_path="customers.email").column == "email"
+    assert FieldMetadata(field_path="email").column == "email"
@@ -0,0 +1,86 @@
+"""Tests for the Postgres tokenization path."""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from action import db_pg, token_logic
+from action.models import DatasetRef
+from action.sdk_adapter import TokenizationSDKAdapter
+
+DATASET = DatasetRef.from_urn(
+    "urn:li:dataset:(urn:li:dataPlatform:postgres,public.customers,PROD)"
+)
+
+
+class FakeCursor:
+    def __init__(self, rows: List[Tuple[object, ...]]) -> None:
+        self.rows = rows
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, query: object, params: object) -> None:
+        pass
+
+    def fetchall(self) -> List[Tuple[object, ...]]:
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, rows: List[Tuple[object, ...]]) -> None:
+        self._cursor = FakeCursor(rows)
+        self.committed = False
+
+    def __enter__(self) -> "FakeConnection":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def cursor(self) -> FakeCursor:
+        return self._cursor
+
+    def commit(self) -> None:
+        self.committed = True
+
+
+def test_updates_are_batched_per_column_subset(monkeypatch) -> None:
+    tok = token_logic.generate_token
+    rows = [
+        (1, "a@example.com", "555-0001"),
+        (2, None, "555-0002"),
+        (3, tok("c@example.com"), None),
+        (4, "d@example.com", "555-0004"),
+    ]
+    connection = FakeConnection(rows)
+    batches = []
+    monkeypatch.setattr(db_pg.psycopg2, "connect", lambda conn_str: connection)
+    monkeypatch.setattr(
+        db_pg,
+        "execute_batch",
+        lambda cursor, query, params, page_size: batches.append((query, params)),
+    )
+
+    result = db_pg.tokenize_table(
+        "dbname=test", DATASET, ["email", "phone"], 100, TokenizationSDKAdapter()
+    )
+
+    assert batches == [
+        (
+            db_pg._build_update_query(DATASET, ("email", "phone")),
+            [
+                [tok("a@example.com"), tok("555-0001"), 1],
+                [tok("d@example.com"), tok("555-0004"), 4],
+            ],
+        ),
+        (
+            db_pg._build_update_query(DATASET, ("phone",)),
+            [[tok("555-0002"), 2]],
+        ),
+    ]
+    assert (result.rows_updated, result.rows_skipped) == (3, 1)
+    assert connection.committed
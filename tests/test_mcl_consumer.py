@@ -0,0 +1,85 @@
+"""Tests for the polling consumer."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from action.datahub_client import RUN_TAG_URN
+from action.mcl_consumer import MCLConsumer
+from action.models import DatasetMetadata, DatasetRef, FieldMetadata
+
+
+def make_dataset(
+    name: str, *, tagged: bool = False, tagged_fields: Sequence[str] = ()
+) -> DatasetMetadata:
+    urn = f"urn:li:dataset:(urn:li:dataPlatform:postgres,public.{name},PROD)"
+    return DatasetMetadata(
+        urn=urn,
+        ref=DatasetRef.from_urn(urn),
+        platform="postgres",
+        global_tags={RUN_TAG_URN} if tagged else set(),
+        fields=[
+            FieldMetadata(field_path=path, tags={RUN_TAG_URN}) for path in tagged_fields
+        ],
+    )
+
+
+class FakeClient:
+    def __init__(
+        self,
+        datasets: List[DatasetMetadata],
+        current: Optional[Dict[str, Optional[DatasetMetadata]]] = None,
+    ) -> None:
+        self.datasets = {dataset.urn: dataset for dataset in datasets}
+        self.current = dict(self.datasets, **(current or {}))
+        self.batches: List[List[str]] = []
+
+    def list_all_dataset_urns(self) -> List[str]:
+        return list(self.datasets)
+
+    def get_datasets(self, urns: Sequence[str]) -> List[Optional[DatasetMetadata]]:
+        self.batches.append(list(urns))
+        return [self.datasets[urn] for urn in urns]
+
+    def get_dataset(self, urn: str) -> Optional[DatasetMetadata]:
+        return self.current[urn]
+
+
+class FakeRunManager:
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, Optional[List[str]]]] = []
+
+    def process(
+        self, dataset: DatasetMetadata, explicit_scope: Optional[Sequence[str]]
+    ) -> None:
+        self.calls.append(
+            (dataset.urn, None if explicit_scope is None else list(explicit_scope))
+        )
+
+
+def test_poll_once_batches_and_processes_tagged_datasets_in_order() -> None:
+    datasets = [
+        make_dataset("a"),
+        make_dataset("b", tagged=True),
+        make_dataset("c"),
+        make_dataset("d", tagged_fields=["d.email"]),
+        make_dataset("e", tagged=True),
+    ]
+    client = FakeClient(datasets)
+    manager = FakeRunManager()
+
+    MCLConsumer(client, manager, fetch_workers=2, fetch_batch_size=2)._poll_once()
+
+    urns = [dataset.urn for dataset in datasets]
+    assert client.batches == [urns[0:2], urns[2:4], urns[4:5]]
+    assert manager.calls == [(urns[1], None), (urns[3], ["d.email"]), (urns[4], None)]
+
+
+def test_poll_once_skips_dataset_whose_tag_was_removed() -> None:
+    stale = make_dataset("a", tagged=True)
+    client = FakeClient([stale], current={stale.urn: make_dataset("a")})
+    manager = FakeRunManager()
+
+    MCLConsumer(client, manager)._poll_once()
+
+    assert manager.calls == []
@@ -0,0 +1,16 @@
+from action import token_logic
+from action.sdk_adapter import TokenizationSDKAdapter
+
+
+def test_tokenize_row_skips_nulls_and_existing_tokens():
+    adapter = TokenizationSDKAdapter()
+    existing = token_logic.generate_token("555-1234")
+    updates = adapter.tokenize_row(
+        ["email", "phone", "notes"], ["user@example.com", existing, None]
+    )
+    assert updates == {"email": token_logic.generate_token("user@example.com")}
+
+
+def test_tokenize_row_returns_empty_when_nothing_to_do():
+    adapter = TokenizationSDKAdapter()
+    assert adapter.tokenize_row(["email"], [None]) == {}
@@ -31,3 +31,21 @@ def test_run_status_serialises_to_json() -> None:
     assert decoded["rows_updated"] == 42
     assert decoded["columns"] == ["email", "phone"]
     assert decoded["started_at"].startswith("2024-01-01T12:00:00")
+
+
+def test_run_status_json_matches_manual_payload() -> None:
+    status = RunStatus(
+        run_id="abc",
+        started_at=datetime(2024, 1, 1, 12, 0, 0),
+        ended_at=None,
+        platform="postgres",
+        columns=["email"],
+        rows_updated=0,
+        rows_skipped=3,
+        status="FAILED",
+        message="boom",
+    )
+    payload = status.dict()
+    payload["started_at"] = status.started_at.isoformat()
+    payload["ended_at"] = None
+    assert status.json() == json.dumps(payload)
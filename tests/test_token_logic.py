@@ -15,3 +15,12 @@ def test_tokenize_if_needed_skips_existing_tokens():
     assert token_logic.tokenize_if_needed(token) == token
     assert token_logic.tokenize_if_needed(original) == token
     assert token_logic.tokenize_if_needed(None) is None
+
+
+def test_is_token_rejects_near_misses():
+    assert not token_logic.is_token("user@example.com")
+    assert not token_logic.is_token("tok_abc")
+    assert not token_logic.is_token("abc_poc")
+    assert not token_logic.is_token("tok_a b_poc")
+    assert not token_logic.is_token("tok_abc_poc\n")
+    assert not token_logic.is_token(None)